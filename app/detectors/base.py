@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from app.models.protocol import ContractEntry
 
 
-@dataclass
+@dataclass(slots=True)
 class DetectionResult:
     interacted: bool = False
     interaction_count: int = 0
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import logging
+import re
+import sys
 
 from app.detectors.base import DetectionResult
 from app.models.protocol import ContractEntry
@@ -21,55 +23,76 @@ class ProgramIdMatchDetector:
         parsed_txs: list[dict],
     ) -> DetectionResult:
         result = DetectionResult()
-        program_id = contract.address.strip()
+        # Interned so the per-instruction == checks below can short-circuit
+        # on pointer identity when tx program IDs are interned too.
+        program_id = sys.intern(contract.address.strip())
 
         config = contract.detection_config
-        discriminators: set[str] = set()
+        discriminators: frozenset[str] = frozenset()
+        disc_re: re.Pattern[str] | None = None
         if config and config.instruction_discriminators:
-            discriminators = set(config.instruction_discriminators)
+            discriminators = frozenset(config.instruction_discriminators)
+            # Compiled once per contract: one DFA pass per instruction
+            # instead of N startswith checks. Longest-first keeps
+            # overlapping prefixes from masking each other.
+            disc_re = re.compile(
+                "|".join(
+                    re.escape(d)
+                    for d in sorted(discriminators, key=len, reverse=True)
+                )
+            )
 
         matching_txs = []
         for tx in parsed_txs:
-            if _tx_involves_program(tx, program_id, discriminators):
+            if _tx_involves_program(tx, program_id, discriminators, disc_re):
                 matching_txs.append(tx)
 
         if matching_txs:
             result.interacted = True
             result.interaction_count = len(matching_txs)
 
-            # Extract interaction types from Helius parsed type field
+            # Single pass: Helius parsed type field plus running min/max
+            # timestamps — no intermediate list, no extra iteration.
             types_seen: set[str] = set()
+            min_ts: int | None = None
+            max_ts: int | None = None
             for tx in matching_txs:
-                tx_type = tx.get("type", "unknown")
-                types_seen.add(tx_type)
-            result.signal_types = list(types_seen)
-
-            # Extract timestamps for first/last seen
-            timestamps: list[int] = []
-            for tx in matching_txs:
+                types_seen.add(tx.get("type", "unknown"))
                 ts = tx.get("timestamp")
                 if ts:
-                    timestamps.append(ts)
-            if timestamps:
-                result.first_seen = str(min(timestamps))
-                result.last_seen = str(max(timestamps))
+                    if min_ts is None or ts < min_ts:
+                        min_ts = ts
+                    if max_ts is None or ts > max_ts:
+                        max_ts = ts
+            result.signal_types = list(types_seen)
+            if min_ts is not None:
+                result.first_seen = str(min_ts)
+                result.last_seen = str(max_ts)
 
         return result
 
 
 def _tx_involves_program(
-    tx: dict, program_id: str, discriminators: set[str]
+    tx: dict,
+    program_id: str,
+    discriminators: frozenset[str] | set[str],
+    disc_re: re.Pattern[str] | None = None,
 ) -> bool:
     """Check if a parsed transaction involves the given program ID.
 
     Works with both Helius enhanced format and raw jsonParsed format.
+    `disc_re` is an optional precompiled alternation of the discriminator
+    prefixes; without it the discriminators are checked one by one.
     """
     # Helius enhanced format: check instructions array
     for ix in tx.get("instructions", []):
         if ix.get("programId") == program_id:
             if discriminators:
                 data = ix.get("data", "")
-                if any(data.startswith(d) for d in discriminators):
+                if disc_re is not None:
+                    if disc_re.match(data):
+                        return True
+                elif any(data.startswith(d) for d in discriminators):
                     return True
             else:
                 return True
@@ -27,6 +27,12 @@ class ProtocolCategory(str, Enum):
     ORACLE = "oracle"
 
 
+# Built once at import — membership checks against these are O(1) with no
+# per-call set comprehension.
+VALID_DETECTION_MODES: frozenset[str] = frozenset(e.value for e in DetectionMode)
+VALID_CATEGORIES: frozenset[str] = frozenset(e.value for e in ProtocolCategory)
+
+
 class EventSignatureConfig(BaseModel):
     topic0: str
     user_address_position: str  # e.g. "topic1", "topic2"
@@ -1,8 +1,29 @@
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+import sys
+from typing import Any
 
+from pydantic import BaseModel, Field, field_validator
 
+
+# Per-class pydantic-core serializers, resolved once. Calling to_python on
+# the cached serializer skips the attribute resolution model_dump repeats
+# on every call — this matters on the per-request response dump path.
+_serializer_cache: dict[type, Any] = {}
+
+
+def dump(model: BaseModel, *, by_alias: bool = True) -> dict[str, Any]:
+    cls = type(model)
+    ser = _serializer_cache.get(cls)
+    if ser is None:
+        ser = _serializer_cache.setdefault(cls, cls.__pydantic_serializer__)
+    return ser.to_python(model, by_alias=by_alias)
+
+
+# The signal models stay Pydantic on purpose: ScanResponse nests them, so
+# the whole response graph serializes in one pydantic-core (Rust) pass.
+# Moving them to msgspec.Struct would split the graph across two
+# serializers and reintroduce a Python-level bridge at the boundary.
 class TokenlessSignal(BaseModel):
     protocol_id: str
     protocol_name: str
@@ -12,10 +33,17 @@ class TokenlessSignal(BaseModel):
     first_seen: str | None = None
     last_seen: str | None = None
     interaction_count: int = 0
-    signal_types: list[str] = []
+    signal_types: tuple[str, ...] = ()
     signal_strength: str = "none"  # none, weak, moderate, strong
     detection_mode: str
 
+    @field_validator("category", "signal_strength", "detection_mode")
+    @classmethod
+    def _intern(cls, v: str) -> str:
+        # Tiny fixed vocabularies repeated across every signal — interning
+        # shares one object per value and makes hot == checks identity-fast.
+        return sys.intern(v)
+
     model_config = {
         "json_schema_extra": {
             "example": {
@@ -43,6 +71,26 @@ class TokenedSignal(BaseModel):
     interacted: bool
     note: str = ""
 
+    @field_validator("category")
+    @classmethod
+    def _intern(cls, v: str) -> str:
+        return sys.intern(v)
+
+    model_config = {"frozen": True}
+
+
+# Field declaration order doubles as bit order for the coverage bitmask.
+_COVERAGE_FIELDS = (
+    "dex", "lending", "bridge", "nft", "social",
+    "governance", "yield_", "perps", "liquid_staking", "oracle",
+)
+
+# Category name (public alias form) -> bit, for OR-aggregation of coverage.
+CATEGORY_BITS: dict[str, int] = {
+    ("yield" if name == "yield_" else name): 1 << i
+    for i, name in enumerate(_COVERAGE_FIELDS)
+}
+
 
 class CategoryCoverage(BaseModel):
     dex: bool = False
@@ -56,7 +104,43 @@ class CategoryCoverage(BaseModel):
     liquid_staking: bool = False
     oracle: bool = False
 
-    model_config = {"populate_by_name": True}
+    model_config = {"frozen": True, "populate_by_name": True}
+
+    def model_dump(self, *, by_alias: bool = True, **kwargs: Any) -> dict[str, Any]:
+        # The field set and alias map are fixed at class definition (only
+        # yield_ -> "yield"), so a dict literal replaces pydantic's generic
+        # reflective serializer on this hot path. Every caller wants the
+        # public alias form, which is all this specialization emits.
+        return {
+            "dex": self.dex,
+            "lending": self.lending,
+            "bridge": self.bridge,
+            "nft": self.nft,
+            "social": self.social,
+            "governance": self.governance,
+            "yield": self.yield_,
+            "perps": self.perps,
+            "liquid_staking": self.liquid_staking,
+            "oracle": self.oracle,
+        }
+
+    @classmethod
+    def from_flags(cls, bits: int) -> CategoryCoverage:
+        """Build coverage from a bitmask (bit i = field i in declaration order).
+
+        The flags are plain bools derived right here, so model_construct
+        skips the 10-field validation pass on every summary build.
+        """
+        return cls.model_construct(
+            **{name: bool(bits & (1 << i)) for i, name in enumerate(_COVERAGE_FIELDS)}
+        )
+
+
+# Default sub-models are shared singletons: pydantic-core reuses the default
+# object on every construction rather than rebuilding it, which is safe here
+# because the models are frozen. No custom __init__ needed — the schema
+# already pre-bakes scalar defaults the same way.
+_DEFAULT_COVERAGE = CategoryCoverage()
 
 
 class SummaryMetrics(BaseModel):
@@ -66,13 +150,20 @@ class SummaryMetrics(BaseModel):
     recency_score: float = 0.0
     diversity_score: float = 0.0
     overall_likelihood: str = "minimal"  # minimal, low, medium, high
-    category_coverage: CategoryCoverage = CategoryCoverage()
+    category_coverage: CategoryCoverage = _DEFAULT_COVERAGE
+
+    model_config = {"frozen": True}
+
+
+_DEFAULT_SUMMARY = SummaryMetrics()
 
 
 class NextAction(BaseModel):
     action: str
     reason: str
-    suggested_protocols: list[str] = []
+    suggested_protocols: tuple[str, ...] = ()
+
+    model_config = {"frozen": True}
 
 
 DISCLAIMER = (
@@ -87,6 +178,8 @@ class SkippedProtocol(BaseModel):
     protocol_id: str
     reason: str
 
+    model_config = {"frozen": True}
+
 
 class ScanResponse(BaseModel):
     address: str
@@ -96,11 +189,15 @@ class ScanResponse(BaseModel):
     scan_window_days: int
     wallet_type: str = "eoa"  # eoa, contract, unknown
 
-    tokenless_signals: list[TokenlessSignal] = []
-    tokened_signals: list[TokenedSignal] = []
-    summary: SummaryMetrics = SummaryMetrics()
-    next_actions: list[NextAction] = []
-    skipped_protocols: list[SkippedProtocol] = []
+    # Tuple defaults: the empty tuple is a shared singleton, so untouched
+    # fields cost no per-instance list allocation.
+    tokenless_signals: tuple[TokenlessSignal, ...] = ()
+    tokened_signals: tuple[TokenedSignal, ...] = ()
+    summary: SummaryMetrics = _DEFAULT_SUMMARY
+    next_actions: tuple[NextAction, ...] = ()
+    skipped_protocols: tuple[SkippedProtocol, ...] = ()
     partial_scan_note: str | None = None
     wallet_note: str | None = None
     disclaimer: str = DISCLAIMER
+
+    model_config = {"frozen": True}
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import logging
+import sys
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Request, Response
 
 from app.config import settings
 from app.models.response import ScanResponse, SkippedProtocol
@@ -66,6 +67,11 @@ async def airdrop_exposure_scan(chain: str, request: Request):
     if err:
         return error_response(400, err)
 
+    # Path strings from routing are not interned; interning once here
+    # lets every downstream dict dispatch keyed on the chain name resolve
+    # by pointer equality with a cached hash.
+    chain = sys.intern(chain)
+
     body = getattr(request.state, "parsed_body", {})
     client_ip = request.client.host if request.client else "unknown"
     logger.info(f"POST /{chain} from {client_ip}, parsed_body={body}")
@@ -103,7 +109,7 @@ async def airdrop_exposure_scan(chain: str, request: Request):
     cached = scan_cache.get(cache_key)
     if cached:
         logger.info(f"Cache hit for {cache_key}")
-        return cached
+        return Response(content=cached, media_type="application/json")
 
     protocols = protocol_db.get_by_chain(chain)
     if not protocols:
@@ -181,9 +187,11 @@ async def airdrop_exposure_scan(chain: str, request: Request):
         wallet_note=wallet_note,
     )
 
-    result = response.model_dump(by_alias=True)
+    # pydantic-core writes JSON directly from the model graph — no
+    # intermediate dict, and FastAPI's jsonable_encoder pass is skipped.
+    payload = response.model_dump_json(by_alias=True)
 
-    scan_cache.set(cache_key, result)
+    scan_cache.set(cache_key, payload)
     logger.info(
         f"Scan complete for {cache_key}: "
         f"tokenless_signals={len(tokenless_signals)}, "
@@ -191,7 +199,7 @@ async def airdrop_exposure_scan(chain: str, request: Request):
         f"completeness={completeness}"
     )
 
-    return result
+    return Response(content=payload, media_type="application/json")
 
 
 async def _detect_wallet_type(address: str, chain: str) -> str:
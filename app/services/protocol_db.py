@@ -13,13 +13,30 @@ _DATA_DIR = Path(__file__).resolve().parent.parent.parent / "data" / "protocols"
 
 class ProtocolDB:
     def __init__(self):
-        self._protocols: dict[str, Protocol] = {}
+        self._by_id: dict[str, Protocol] = {}
         self._by_chain: dict[str, list[Protocol]] = {}
+        self._tokenless_by_chain: dict[str, list[Protocol]] = {}
+        self._tokened_by_chain: dict[str, list[Protocol]] = {}
+        # chain -> (total, tokenless, tokened), filled once in load().
+        self._counts: dict[str, tuple[int, int, int]] = {}
+        self._loaded = False
 
     def load(self) -> None:
-        self._protocols.clear()
-        self._by_chain.clear()
+        # The protocol JSON on disk is static for the process lifetime, so
+        # repeat calls are a no-op instead of a full re-parse.
+        if self._loaded:
+            return
 
+        self._by_id.clear()
+        self._by_chain.clear()
+        self._tokenless_by_chain.clear()
+        self._tokened_by_chain.clear()
+        self._counts.clear()
+
+        # The whole catalog (all chains, contracts included) is parsed
+        # eagerly here on purpose: one process serves every chain, the
+        # catalog is a few dozen small files, and eager validation surfaces
+        # bad protocol JSON at startup instead of mid-request.
         for chain_dir in _DATA_DIR.iterdir():
             if not chain_dir.is_dir() or chain_dir.name.startswith("."):
                 continue
@@ -28,35 +45,56 @@ class ProtocolDB:
 
             for proto_file in sorted(chain_dir.glob("*.json")):
                 try:
-                    data = json.loads(proto_file.read_text())
-                    protocol = Protocol(**data)
-                    self._protocols[protocol.id] = protocol
+                    # read_bytes + model_validate: json.loads decodes UTF-8
+                    # bytes directly, and validation happens in one
+                    # pydantic-core pass instead of Python kwargs unpacking.
+                    data = json.loads(proto_file.read_bytes())
+                    protocol = Protocol.model_validate(data)
+                    self._by_id[protocol.id] = protocol
                     self._by_chain[chain].append(protocol)
+                    split = (
+                        self._tokened_by_chain
+                        if protocol.has_token
+                        else self._tokenless_by_chain
+                    )
+                    split.setdefault(chain, []).append(protocol)
                 except Exception as e:
                     logger.error(f"Failed to load {proto_file}: {e}")
 
-        total = len(self._protocols)
-        chains = {p.chain for p in self._protocols.values()}
+        for chain, protocols in self._by_chain.items():
+            self._counts[chain] = (
+                len(protocols),
+                len(self._tokenless_by_chain.get(chain, [])),
+                len(self._tokened_by_chain.get(chain, [])),
+            )
+
+        total = len(self._by_id)
+        chains = {p.chain for p in self._by_id.values()}
         logger.info(f"Loaded {total} protocols across chains: {chains}")
+        self._loaded = True
 
     def get(self, protocol_id: str) -> Protocol | None:
-        return self._protocols.get(protocol_id)
+        return self._by_id.get(protocol_id)
 
     def get_by_chain(self, chain: str) -> list[Protocol]:
         return self._by_chain.get(chain, [])
 
     def get_tokenless(self, chain: str) -> list[Protocol]:
-        return [p for p in self.get_by_chain(chain) if not p.has_token]
+        return self._tokenless_by_chain.get(chain, [])
 
     def get_tokened(self, chain: str) -> list[Protocol]:
-        return [p for p in self.get_by_chain(chain) if p.has_token]
+        return self._tokened_by_chain.get(chain, [])
+
+    def counts(self, chain: str) -> tuple[int, int, int]:
+        """(total, tokenless, tokened) for a chain, precomputed at load time."""
+        return self._counts.get(chain, (0, 0, 0))
 
     def all_protocols(self) -> list[Protocol]:
-        return list(self._protocols.values())
+        return list(self._by_id.values())
 
     @property
     def count(self) -> int:
-        return len(self._protocols)
+        return len(self._by_id)
 
 
 protocol_db = ProtocolDB()
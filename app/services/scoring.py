@@ -1,9 +1,14 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
 from datetime import datetime, timezone
+from functools import lru_cache
+from heapq import nlargest
+from operator import attrgetter
 
 from app.models.response import (
+    CATEGORY_BITS,
     CategoryCoverage,
     NextAction,
     SummaryMetrics,
@@ -11,14 +16,34 @@ from app.models.response import (
     TokenlessSignal,
 )
 
+# This module deliberately stays pure Python. Scoring runs once per
+# protocol per scan — microseconds next to the RPC round-trips that feed
+# it — so an AOT-compiled extension (Cython/mypyc) would complicate the
+# build for no user-visible latency win. JIT decorators (numba @njit) are
+# a worse fit still: their cold-start compilation costs seconds per
+# function on every fresh process, including each test run. Revisit only
+# if scans ever score thousands of protocols per request, and prefer AOT
+# over JIT if that day comes.
+
 logger = logging.getLogger("scoring")
 
+_protocol_weight = attrgetter("protocol_weight")
+
 
+@lru_cache(maxsize=4096)
 def _parse_date(date_str: str | None) -> datetime | None:
-    if not date_str:
+    # The same date strings recur across the signals of a scan, so results
+    # are memoized; datetime is immutable, making the cache safe to share.
+    # Dates are always YYYY-MM-DD here; slicing avoids strptime's
+    # per-call format-string interpretation, which adds up when this runs
+    # for every protocol in a scan.
+    if not date_str or len(date_str) != 10 or date_str[4] != "-" or date_str[7] != "-":
         return None
     try:
-        return datetime.strptime(date_str, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+        return datetime(
+            int(date_str[:4]), int(date_str[5:7]), int(date_str[8:10]),
+            tzinfo=timezone.utc,
+        )
     except ValueError:
         return None
 
@@ -38,40 +63,40 @@ def calculate_strength(
     if count == 0:
         return "none"
 
-    now = _now_utc()
-    type_diversity = len({t for t in types if t != "unknown_interaction"})
+    # Ordinal day numbers make the date arithmetic plain int subtraction
+    # instead of allocating a timedelta per comparison.
+    now_ord = _now_utc().toordinal()
+    # set() dedupes in C; a single discard beats filtering every element
+    # through a Python-level comparison in a comprehension.
+    types_set = set(types)
+    types_set.discard("unknown_interaction")
+    type_diversity = len(types_set)
     parsed_first = _parse_date(first_seen)
     parsed_last = _parse_date(last_seen)
-    days_since_last = (now - parsed_last).days if parsed_last else 999
-
-    score = 0
+    days_since_last = now_ord - parsed_last.toordinal() if parsed_last else 999
 
+    # Bucketed points as conditional expressions — fewer interpreted
+    # branches than the if/elif cascades in this per-protocol hot path.
     # Interaction count (0-3 pts)
-    if count >= 10:
-        score += 3
-    elif count >= 5:
-        score += 2
-    elif count >= 2:
-        score += 1
+    score = 3 if count >= 10 else 2 if count >= 5 else 1 if count >= 2 else 0
 
-    # Type diversity (0-3 pts)
-    if type_diversity >= 3:
-        score += 3
-    elif type_diversity >= 2:
-        score += 2
-    elif type_diversity >= 1:
-        score += 1
+    # Type diversity (0-3 pts): one point per distinct type, capped at 3
+    score += min(type_diversity, 3)
 
     # Recency (0-3 pts)
-    if days_since_last <= 7:
-        score += 3
-    elif days_since_last <= 30:
-        score += 2
-    elif days_since_last <= 90:
-        score += 1
+    score += (
+        3 if days_since_last <= 7
+        else 2 if days_since_last <= 30
+        else 1 if days_since_last <= 90
+        else 0
+    )
 
     # Duration (0-1 pt)
-    if parsed_first and parsed_last and (parsed_last - parsed_first).days >= 30:
+    if (
+        parsed_first
+        and parsed_last
+        and parsed_last.toordinal() - parsed_first.toordinal() >= 30
+    ):
         score += 1
 
     score *= protocol_weight
@@ -86,37 +111,49 @@ def calculate_strength(
 
 
 def build_summary(
-    tokenless_signals: list[TokenlessSignal],
-    tokened_signals: list[TokenedSignal],
+    tokenless_signals: Iterable[TokenlessSignal],
+    tokened_signals: Iterable[TokenedSignal],
 ) -> SummaryMetrics:
     """Only tokenless protocols drive overall likelihood."""
-    all_signals = tokenless_signals + tokened_signals
-
-    tokenless_interacted = [s for s in tokenless_signals if s.interacted]
-    all_interacted = [s for s in all_signals if s.interacted]
-
-    # Recency score (tokenless only, 180-day decay)
-    now = _now_utc()
-    if tokenless_interacted:
-        recency_values = []
-        for s in tokenless_interacted:
+    # One pass per input accumulating every metric at once: totals,
+    # interacted count, recency sum (tokenless only, 180-day decay),
+    # category sets for diversity, and the coverage bitmask. Each input is
+    # iterated exactly once, so generators work too. The clock is read
+    # once and kept as an ordinal day so recency is int math.
+    now_ord = _now_utc().toordinal()
+    tokenless_total = 0
+    tokened_total = 0
+    tc = 0
+    recency_sum = 0.0
+    all_categories: set[str] = set()
+    interacted_categories: set[str] = set()
+    coverage_bits = 0
+
+    for s in tokenless_signals:
+        tokenless_total += 1
+        all_categories.add(s.category)
+        if s.interacted:
+            tc += 1
+            interacted_categories.add(s.category)
+            coverage_bits |= CATEGORY_BITS.get(s.category, 0)
             parsed = _parse_date(s.last_seen)
-            recency_values.append(
-                max(0.0, 1.0 - ((now - parsed).days / 180.0)) if parsed else 0.0
-            )
-        recency_score = round(sum(recency_values) / len(recency_values), 2)
-    else:
-        recency_score = 0.0
-
-    # Diversity score (all protocols)
-    all_categories = {s.category for s in all_signals}
-    interacted_categories = {s.category for s in all_interacted}
+            if parsed:
+                days = now_ord - parsed.toordinal()
+                recency_sum += max(0.0, 1.0 - (days / 180.0))
+
+    for s in tokened_signals:
+        tokened_total += 1
+        all_categories.add(s.category)
+        if s.interacted:
+            interacted_categories.add(s.category)
+            coverage_bits |= CATEGORY_BITS.get(s.category, 0)
+
+    recency_score = round(recency_sum / tc, 2) if tc else 0.0
     diversity_score = round(
         len(interacted_categories) / max(len(all_categories), 1), 2
     )
 
     # Overall likelihood (tokenless only)
-    tc = len(tokenless_interacted)
     if tc >= 5 and recency_score >= 0.5 and diversity_score >= 0.5:
         likelihood = "high"
     elif tc >= 2 and (recency_score >= 0.3 or diversity_score >= 0.3):
@@ -128,22 +165,20 @@ def build_summary(
 
     return SummaryMetrics(
         tokenless_protocols_interacted=tc,
-        tokenless_protocols_available=len(tokenless_signals),
-        total_protocols_scanned=len(all_signals),
+        tokenless_protocols_available=tokenless_total,
+        total_protocols_scanned=tokenless_total + tokened_total,
         recency_score=recency_score,
         diversity_score=diversity_score,
         overall_likelihood=likelihood,
-        category_coverage=_build_coverage(all_interacted),
+        category_coverage=CategoryCoverage.from_flags(coverage_bits),
     )
 
 
 def _build_coverage(interacted_signals: list) -> CategoryCoverage:
-    hit = {s.category for s in interacted_signals}
-    return CategoryCoverage(**{
-        ("yield_" if c == "yield" else c): c in hit
-        for c in ("dex", "lending", "bridge", "nft", "social",
-                   "governance", "yield", "perps", "liquid_staking", "oracle")
-    })
+    bits = 0
+    for s in interacted_signals:
+        bits |= CATEGORY_BITS.get(s.category, 0)
+    return CategoryCoverage.from_flags(bits)
 
 
 def generate_next_actions(
@@ -152,21 +187,27 @@ def generate_next_actions(
     chain: str,
 ) -> list[NextAction]:
     """Suggest up to 3 actions for uncovered categories."""
-    coverage_dict = summary.category_coverage.model_dump(by_alias=True)
+    coverage_dict = summary.category_coverage.model_dump()
     actions: list[NextAction] = []
 
+    # One pass to bucket non-interacted signals by category, instead of
+    # re-filtering the whole list for every uncovered category.
+    by_category: dict[str, list[TokenlessSignal]] = {}
+    for s in tokenless_signals:
+        if not s.interacted:
+            by_category.setdefault(s.category, []).append(s)
+
     for category, covered in coverage_dict.items():
         if covered:
             continue
 
-        candidates = sorted(
-            [s for s in tokenless_signals if s.category == category and not s.interacted],
-            key=lambda s: s.protocol_weight,
-            reverse=True,
-        )
+        candidates = by_category.get(category)
         if not candidates:
             continue
 
+        # Only the top 2 by weight are suggested; nlargest is O(N) here
+        # versus O(N log N) for a full sort, with the same tie ordering.
+        top = nlargest(2, candidates, key=_protocol_weight)
         actions.append(
             NextAction(
                 action=f"Interact with a {category} protocol on {chain.title()}",
@@ -174,7 +215,7 @@ def generate_next_actions(
                     f"You have no {category} interactions — "
                     f"this category is commonly included in airdrop criteria"
                 ),
-                suggested_protocols=[c.protocol_name for c in candidates[:2]],
+                suggested_protocols=[c.protocol_name for c in top],
             )
         )
 
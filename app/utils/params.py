@@ -1,17 +1,36 @@
 from __future__ import annotations
 
+# Distinguishes "key absent" from an explicit None value without paying
+# for a second `in` lookup: dict.get with a sentinel is one hash probe.
+_MISSING = object()
+
 
 def extract_param(
     request_body: dict, param_name: str, aliases: list[str] | None = None
 ) -> str | None:
-    aliases = aliases or []
-    all_names = [param_name] + aliases
+    # Fast path: the canonical name at the top level covers the vast
+    # majority of requests, so it is checked before any alias iteration.
+    value = request_body.get(param_name, _MISSING)
+    if value is not _MISSING:
+        return value
+
+    for alias in aliases or ():
+        value = request_body.get(alias, _MISSING)
+        if value is not _MISSING:
+            return value
 
-    for name in all_names:
-        if name in request_body:
-            return request_body[name]
-        if "body" in request_body and isinstance(request_body["body"], dict):
-            if name in request_body["body"]:
-                return request_body["body"][name]
+    # APIX402 clients can leave params one level down in body["body"];
+    # one get fetches it, and the dict check doubles as the absence test.
+    # type() is dict is a single pointer compare — safe here because the
+    # body comes from json.loads, which never produces dict subclasses.
+    nested = request_body.get("body")
+    if type(nested) is dict:
+        value = nested.get(param_name, _MISSING)
+        if value is not _MISSING:
+            return value
+        for alias in aliases or ():
+            value = nested.get(alias, _MISSING)
+            if value is not _MISSING:
+                return value
 
     return None
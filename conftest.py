@@ -1,63 +1,135 @@
 from __future__ import annotations
 
+from datetime import datetime, timezone
+
 import pytest
 
 from app.models.response import TokenedSignal, TokenlessSignal
 
+# The fixed "current time" every clock-dependent test runs against.
+FROZEN_NOW = datetime(2026, 2, 12, tzinfo=timezone.utc)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _load_protocols():
+    """Parse the protocol database once for the whole session."""
+    from app.services.protocol_db import protocol_db
+
+    protocol_db.load()
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Session-wide TestClient.
+
+    Imported lazily so collecting tests that never touch the API does not
+    pay for app import and ASGI wiring.
+    """
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    return TestClient(app)
+
+
+@pytest.fixture
+def frozen_now(monkeypatch):
+    """Freeze the scoring clock at FROZEN_NOW; returns the frozen datetime.
+
+    monkeypatch.setattr with a plain lambda is much cheaper than
+    unittest.mock.patch (no MagicMock construction or spec inspection),
+    which matters across the dozens of tests that need a fixed clock.
+    The datetime itself is a module constant, not rebuilt per test.
+    """
+    monkeypatch.setattr("app.services.scoring._now_utc", lambda: FROZEN_NOW)
+    return FROZEN_NOW
+
+
+def _make_tokenless_signal(
+    protocol_id: str = "test_proto",
+    protocol_name: str = "Test Protocol",
+    category: str = "dex",
+    protocol_weight: float = 1.0,
+    interacted: bool = False,
+    first_seen: str | None = None,
+    last_seen: str | None = None,
+    interaction_count: int = 0,
+    signal_types: list[str] | None = None,
+    signal_strength: str = "none",
+    detection_mode: str = "event_topic",
+) -> TokenlessSignal:
+    # Inputs here are already the right types, so model_construct skips
+    # validation; signal_types is normalized to the tuple the validated
+    # path would have produced.
+    return TokenlessSignal.model_construct(
+        protocol_id=protocol_id,
+        protocol_name=protocol_name,
+        category=category,
+        protocol_weight=protocol_weight,
+        interacted=interacted,
+        first_seen=first_seen,
+        last_seen=last_seen,
+        interaction_count=interaction_count,
+        signal_types=tuple(signal_types or ()),
+        signal_strength=signal_strength,
+        detection_mode=detection_mode,
+    )
+
+
+def _make_tokened_signal(
+    protocol_id: str = "test_tokened",
+    protocol_name: str = "Tokened Protocol",
+    category: str = "dex",
+    token_symbol: str = "TKN",
+    interacted: bool = False,
+    note: str = "",
+) -> TokenedSignal:
+    return TokenedSignal.model_construct(
+        protocol_id=protocol_id,
+        protocol_name=protocol_name,
+        category=category,
+        token_symbol=token_symbol,
+        interacted=interacted,
+        note=note,
+    )
+
 
 @pytest.fixture
 def make_tokenless_signal():
     """Factory fixture for creating TokenlessSignal instances."""
-
-    def _make(
-        protocol_id: str = "test_proto",
-        protocol_name: str = "Test Protocol",
-        category: str = "dex",
-        protocol_weight: float = 1.0,
-        interacted: bool = False,
-        first_seen: str | None = None,
-        last_seen: str | None = None,
-        interaction_count: int = 0,
-        signal_types: list[str] | None = None,
-        signal_strength: str = "none",
-        detection_mode: str = "event_topic",
-    ) -> TokenlessSignal:
-        return TokenlessSignal(
-            protocol_id=protocol_id,
-            protocol_name=protocol_name,
-            category=category,
-            protocol_weight=protocol_weight,
-            interacted=interacted,
-            first_seen=first_seen,
-            last_seen=last_seen,
-            interaction_count=interaction_count,
-            signal_types=signal_types or [],
-            signal_strength=signal_strength,
-            detection_mode=detection_mode,
-        )
-
-    return _make
+    return _make_tokenless_signal
 
 
 @pytest.fixture
 def make_tokened_signal():
     """Factory fixture for creating TokenedSignal instances."""
+    return _make_tokened_signal
+
+
+ALL_CATEGORIES = (
+    "dex", "lending", "bridge", "nft", "social",
+    "governance", "yield", "perps", "liquid_staking", "oracle",
+)
+
+# Shared read-only signal sets, built once at import instead of per test.
+# Tests that mutate signals must build their own lists with the factories.
+ALL_CATEGORIES_SIGNALS = [
+    _make_tokenless_signal(protocol_id=f"p{i}", category=cat, interacted=True)
+    for i, cat in enumerate(ALL_CATEGORIES)
+]
+
+SIX_UNCOVERED_SIGNALS = [
+    _make_tokenless_signal(
+        protocol_id=f"p{i}", protocol_name=f"Proto {i}",
+        category=cat, interacted=False,
+    )
+    for i, cat in enumerate(ALL_CATEGORIES[:6])
+]
 
-    def _make(
-        protocol_id: str = "test_tokened",
-        protocol_name: str = "Tokened Protocol",
-        category: str = "dex",
-        token_symbol: str = "TKN",
-        interacted: bool = False,
-        note: str = "",
-    ) -> TokenedSignal:
-        return TokenedSignal(
-            protocol_id=protocol_id,
-            protocol_name=protocol_name,
-            category=category,
-            token_symbol=token_symbol,
-            interacted=interacted,
-            note=note,
-        )
-
-    return _make
+FIVE_RECENT_CATEGORY_SIGNALS = [
+    _make_tokenless_signal(
+        protocol_id=f"p{i}", category=cat, interacted=True,
+        last_seen="2026-02-10",
+    )
+    for i, cat in enumerate(ALL_CATEGORIES[:5])
+]
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock
 
 import pytest
 from fastapi.testclient import TestClient
@@ -52,6 +52,22 @@ def _mock_scan_result(address="", chain="base", protocols=None, window_days=90):
     return tokenless, tokened, "full", []
 
 
+@pytest.fixture
+def mocked_scan(monkeypatch):
+    """Wire the scan_wallet/_detect_wallet_type mocks once via monkeypatch.
+
+    Returns (scan, wallet_type). The route reads the patched attributes at
+    call time, so tests can swap side_effect/return_value on the returned
+    mocks before issuing requests. monkeypatch.setattr skips the dotted
+    path resolution and wrapping the @patch decorator repeats per test.
+    """
+    scan = AsyncMock(side_effect=_mock_scan_result)
+    wallet_type = AsyncMock(return_value="eoa")
+    monkeypatch.setattr("app.routes.airdrop.scan_wallet", scan)
+    monkeypatch.setattr("app.routes.airdrop._detect_wallet_type", wallet_type)
+    return scan, wallet_type
+
+
 client = TestClient(app)
 
 
@@ -121,10 +137,9 @@ class TestPostValidation:
         assert resp.status_code == 400
 
 
+@pytest.mark.usefixtures("mocked_scan")
 class TestApix402BodyUnwrapping:
-    @patch("app.routes.airdrop.scan_wallet", new_callable=AsyncMock, side_effect=_mock_scan_result)
-    @patch("app.routes.airdrop._detect_wallet_type", new_callable=AsyncMock, return_value="eoa")
-    def test_flat_body(self, mock_wt, mock_scan):
+    def test_flat_body(self):
         """Standard flat body — address at top level."""
         resp = client.post(
             "/v1/airdrop-exposure/base",
@@ -132,9 +147,7 @@ class TestApix402BodyUnwrapping:
         )
         assert resp.status_code == 200
 
-    @patch("app.routes.airdrop.scan_wallet", new_callable=AsyncMock, side_effect=_mock_scan_result)
-    @patch("app.routes.airdrop._detect_wallet_type", new_callable=AsyncMock, return_value="eoa")
-    def test_nested_body(self, mock_wt, mock_scan):
+    def test_nested_body(self):
         """APIX402 nested body — address inside body.body."""
         resp = client.post(
             "/v1/airdrop-exposure/base",
@@ -142,9 +155,7 @@ class TestApix402BodyUnwrapping:
         )
         assert resp.status_code == 200
 
-    @patch("app.routes.airdrop.scan_wallet", new_callable=AsyncMock, side_effect=_mock_scan_result)
-    @patch("app.routes.airdrop._detect_wallet_type", new_callable=AsyncMock, return_value="eoa")
-    def test_wallet_alias(self, mock_wt, mock_scan):
+    def test_wallet_alias(self):
         """Using 'wallet' alias for address."""
         resp = client.post(
             "/v1/airdrop-exposure/base",
@@ -152,9 +163,7 @@ class TestApix402BodyUnwrapping:
         )
         assert resp.status_code == 200
 
-    @patch("app.routes.airdrop.scan_wallet", new_callable=AsyncMock, side_effect=_mock_scan_result)
-    @patch("app.routes.airdrop._detect_wallet_type", new_callable=AsyncMock, return_value="eoa")
-    def test_query_string_unwrap(self, mock_wt, mock_scan):
+    def test_query_string_unwrap(self):
         """APIX query-string format: {"query": "base=0x...&windowDays=90"}."""
         addr = "0x" + "d" * 40
         resp = client.post(
@@ -167,9 +176,7 @@ class TestApix402BodyUnwrapping:
 class TestResponseStructure:
 
     @pytest.fixture
-    @patch("app.routes.airdrop._detect_wallet_type", new_callable=AsyncMock, return_value="eoa")
-    @patch("app.routes.airdrop.scan_wallet", new_callable=AsyncMock, side_effect=_mock_scan_result)
-    def scan_response(self, mock_scan, mock_wt):
+    def scan_response(self, mocked_scan):
         resp = client.post(
             "/v1/airdrop-exposure/base",
             json={"address": "0x" + "0" * 40},
@@ -233,10 +240,9 @@ class TestResponseStructure:
         assert data["wallet_type"] in ("eoa", "contract", "unknown")
 
 
+@pytest.mark.usefixtures("mocked_scan")
 class TestWindowDays:
-    @patch("app.routes.airdrop._detect_wallet_type", new_callable=AsyncMock, return_value="eoa")
-    @patch("app.routes.airdrop.scan_wallet", new_callable=AsyncMock, side_effect=_mock_scan_result)
-    def test_custom_window_days(self, mock_scan, mock_wt):
+    def test_custom_window_days(self):
         resp = client.post(
             "/v1/airdrop-exposure/base",
             json={"address": "0x" + "0" * 40, "windowDays": 60},
@@ -244,9 +250,7 @@ class TestWindowDays:
         assert resp.status_code == 200
         assert resp.json()["scan_window_days"] == 60
 
-    @patch("app.routes.airdrop._detect_wallet_type", new_callable=AsyncMock, return_value="eoa")
-    @patch("app.routes.airdrop.scan_wallet", new_callable=AsyncMock, side_effect=_mock_scan_result)
-    def test_window_days_clamped_low(self, mock_scan, mock_wt):
+    def test_window_days_clamped_low(self):
         resp = client.post(
             "/v1/airdrop-exposure/base",
             json={"address": "0x" + "0" * 40, "windowDays": 5},
@@ -254,9 +258,7 @@ class TestWindowDays:
         assert resp.status_code == 200
         assert resp.json()["scan_window_days"] == 30  # min is 30
 
-    @patch("app.routes.airdrop._detect_wallet_type", new_callable=AsyncMock, return_value="eoa")
-    @patch("app.routes.airdrop.scan_wallet", new_callable=AsyncMock, side_effect=_mock_scan_result)
-    def test_window_days_clamped_high(self, mock_scan, mock_wt):
+    def test_window_days_clamped_high(self):
         resp = client.post(
             "/v1/airdrop-exposure/base",
             json={"address": "0x" + "0" * 40, "windowDays": 999},
@@ -264,9 +266,7 @@ class TestWindowDays:
         assert resp.status_code == 200
         assert resp.json()["scan_window_days"] == 180  # max is 180
 
-    @patch("app.routes.airdrop._detect_wallet_type", new_callable=AsyncMock, return_value="eoa")
-    @patch("app.routes.airdrop.scan_wallet", new_callable=AsyncMock, side_effect=_mock_scan_result)
-    def test_invalid_window_days_defaults_to_90(self, mock_scan, mock_wt):
+    def test_invalid_window_days_defaults_to_90(self):
         resp = client.post(
             "/v1/airdrop-exposure/base",
             json={"address": "0x" + "0" * 40, "windowDays": "not_a_number"},
@@ -276,9 +276,7 @@ class TestWindowDays:
 
 
 class TestCaching:
-    @patch("app.routes.airdrop._detect_wallet_type", new_callable=AsyncMock, return_value="eoa")
-    @patch("app.routes.airdrop.scan_wallet", new_callable=AsyncMock, side_effect=_mock_scan_result)
-    def test_second_request_uses_cache(self, mock_scan, mock_wt):
+    def test_second_request_uses_cache(self, mocked_scan):
         addr = "0x" + "1" * 40
         body = {"address": addr}
 
@@ -293,9 +291,8 @@ class TestCaching:
         # Cache hit → same timestamp
         assert ts1 == ts2
 
-    @patch("app.routes.airdrop._detect_wallet_type", new_callable=AsyncMock, return_value="eoa")
-    @patch("app.routes.airdrop.scan_wallet", new_callable=AsyncMock, side_effect=_mock_scan_result)
-    def test_scanner_called_only_once_with_cache(self, mock_scan, mock_wt):
+    def test_scanner_called_only_once_with_cache(self, mocked_scan):
+        scan, _ = mocked_scan
         addr = "0x" + "2" * 40
         body = {"address": addr}
 
@@ -303,7 +300,7 @@ class TestCaching:
         client.post("/v1/airdrop-exposure/base", json=body)
 
         # Scanner should only be called once; second hit is cached
-        assert mock_scan.call_count == 1
+        assert scan.call_count == 1
 
 
 class TestPartialScan:
@@ -316,10 +313,9 @@ class TestPartialScan:
         ]
         return tokenless, [], "partial", ["skipped_proto"]
 
-    @patch("app.routes.airdrop._detect_wallet_type", new_callable=AsyncMock, return_value="eoa")
-    @patch("app.routes.airdrop.scan_wallet", new_callable=AsyncMock)
-    def test_partial_scan_completeness(self, mock_scan, mock_wt):
-        mock_scan.side_effect = self._mock_partial_scan
+    def test_partial_scan_completeness(self, mocked_scan):
+        scan, _ = mocked_scan
+        scan.side_effect = self._mock_partial_scan
         resp = client.post(
             "/v1/airdrop-exposure/base",
             json={"address": "0x" + "a" * 40},
@@ -337,10 +333,9 @@ class TestPartialScan:
             )
         ], [], "full", []
 
-    @patch("app.routes.airdrop._detect_wallet_type", new_callable=AsyncMock, return_value="eoa")
-    @patch("app.routes.airdrop.scan_wallet", new_callable=AsyncMock)
-    def test_full_scan_no_partial_note(self, mock_scan, mock_wt):
-        mock_scan.side_effect = self._mock_full_scan
+    def test_full_scan_no_partial_note(self, mocked_scan):
+        scan, _ = mocked_scan
+        scan.side_effect = self._mock_full_scan
         resp = client.post(
             "/v1/airdrop-exposure/base",
             json={"address": "0x" + "b" * 40},
@@ -351,9 +346,9 @@ class TestPartialScan:
 
 
 class TestWalletType:
-    @patch("app.routes.airdrop.scan_wallet", new_callable=AsyncMock, side_effect=_mock_scan_result)
-    @patch("app.routes.airdrop._detect_wallet_type", new_callable=AsyncMock, return_value="contract")
-    def test_contract_wallet_note(self, mock_wt, mock_scan):
+    def test_contract_wallet_note(self, mocked_scan):
+        _, wallet_type = mocked_scan
+        wallet_type.return_value = "contract"
         resp = client.post(
             "/v1/airdrop-exposure/base",
             json={"address": "0x" + "c" * 40},
@@ -363,9 +358,8 @@ class TestWalletType:
         assert data["wallet_note"] is not None
         assert "smart contract" in data["wallet_note"].lower()
 
-    @patch("app.routes.airdrop.scan_wallet", new_callable=AsyncMock, side_effect=_mock_scan_result)
-    @patch("app.routes.airdrop._detect_wallet_type", new_callable=AsyncMock, return_value="eoa")
-    def test_eoa_wallet_no_note(self, mock_wt, mock_scan):
+    @pytest.mark.usefixtures("mocked_scan")
+    def test_eoa_wallet_no_note(self):
         resp = client.post(
             "/v1/airdrop-exposure/base",
             json={"address": "0x" + "d" * 40},
@@ -374,9 +368,9 @@ class TestWalletType:
         assert data["wallet_type"] == "eoa"
         assert data["wallet_note"] is None
 
-    @patch("app.routes.airdrop.scan_wallet", new_callable=AsyncMock, side_effect=_mock_scan_result)
-    @patch("app.routes.airdrop._detect_wallet_type", new_callable=AsyncMock, return_value="unknown")
-    def test_unknown_wallet_has_note(self, mock_wt, mock_scan):
+    def test_unknown_wallet_has_note(self, mocked_scan):
+        _, wallet_type = mocked_scan
+        wallet_type.return_value = "unknown"
         resp = client.post(
             "/v1/airdrop-exposure/base",
             json={"address": "0x" + "e" * 40},
@@ -413,11 +407,10 @@ class TestResponseDataVerification:
         ]
         return tokenless, tokened, "full", []  # no skipped
 
-    @patch("app.routes.airdrop._detect_wallet_type", new_callable=AsyncMock, return_value="eoa")
-    @patch("app.routes.airdrop.scan_wallet", new_callable=AsyncMock)
-    def test_scoring_applied_to_signals(self, mock_scan, mock_wt):
+    def test_scoring_applied_to_signals(self, mocked_scan):
         """signal_strength should be populated by the scoring engine, not left as 'none'."""
-        mock_scan.side_effect = self._mock_with_interactions
+        scan, _ = mocked_scan
+        scan.side_effect = self._mock_with_interactions
         resp = client.post(
             "/v1/airdrop-exposure/base",
             json={"address": "0x" + "f" * 40},
@@ -430,10 +423,9 @@ class TestResponseDataVerification:
         assert morpho["interaction_count"] == 8
         assert morpho["signal_types"] == ["supply", "borrow"]
 
-    @patch("app.routes.airdrop._detect_wallet_type", new_callable=AsyncMock, return_value="eoa")
-    @patch("app.routes.airdrop.scan_wallet", new_callable=AsyncMock)
-    def test_summary_reflects_signals(self, mock_scan, mock_wt):
-        mock_scan.side_effect = self._mock_with_interactions
+    def test_summary_reflects_signals(self, mocked_scan):
+        scan, _ = mocked_scan
+        scan.side_effect = self._mock_with_interactions
         resp = client.post(
             "/v1/airdrop-exposure/base",
             json={"address": "0x" + "f" * 40 + "1" * 0},  # unique to avoid cache
@@ -451,10 +443,9 @@ class TestResponseDataVerification:
         assert summary["total_protocols_scanned"] == 3  # 2 tokenless + 1 tokened
         assert summary["overall_likelihood"] == "low"  # only 1 tokenless interacted
 
-    @patch("app.routes.airdrop._detect_wallet_type", new_callable=AsyncMock, return_value="eoa")
-    @patch("app.routes.airdrop.scan_wallet", new_callable=AsyncMock)
-    def test_tokened_signal_data(self, mock_scan, mock_wt):
-        mock_scan.side_effect = self._mock_with_interactions
+    def test_tokened_signal_data(self, mocked_scan):
+        scan, _ = mocked_scan
+        scan.side_effect = self._mock_with_interactions
         scan_cache.clear()
         resp = client.post(
             "/v1/airdrop-exposure/base",
@@ -466,10 +457,9 @@ class TestResponseDataVerification:
         assert uni["interacted"] is True
         assert "$UNI" in uni["note"]
 
-    @patch("app.routes.airdrop._detect_wallet_type", new_callable=AsyncMock, return_value="eoa")
-    @patch("app.routes.airdrop.scan_wallet", new_callable=AsyncMock)
-    def test_disclaimer_present(self, mock_scan, mock_wt):
-        mock_scan.side_effect = self._mock_with_interactions
+    def test_disclaimer_present(self, mocked_scan):
+        scan, _ = mocked_scan
+        scan.side_effect = self._mock_with_interactions
         scan_cache.clear()
         resp = client.post(
             "/v1/airdrop-exposure/base",
@@ -479,11 +469,10 @@ class TestResponseDataVerification:
         assert "disclaimer" in data
         assert "not financial advice" in data["disclaimer"].lower()
 
-    @patch("app.routes.airdrop._detect_wallet_type", new_callable=AsyncMock, return_value="eoa")
-    @patch("app.routes.airdrop.scan_wallet", new_callable=AsyncMock)
-    def test_next_actions_generated(self, mock_scan, mock_wt):
+    def test_next_actions_generated(self, mocked_scan):
         """With only lending covered, should suggest other categories."""
-        mock_scan.side_effect = self._mock_with_interactions
+        scan, _ = mocked_scan
+        scan.side_effect = self._mock_with_interactions
         scan_cache.clear()
         resp = client.post(
             "/v1/airdrop-exposure/base",
@@ -496,18 +485,16 @@ class TestResponseDataVerification:
 
 
 class TestCacheKeyIsolation:
-    @patch("app.routes.airdrop._detect_wallet_type", new_callable=AsyncMock, return_value="eoa")
-    @patch("app.routes.airdrop.scan_wallet", new_callable=AsyncMock, side_effect=_mock_scan_result)
-    def test_different_window_days_different_cache(self, mock_scan, mock_wt):
+    def test_different_window_days_different_cache(self, mocked_scan):
+        scan, _ = mocked_scan
         """Different windowDays should produce cache misses."""
         addr = "0x" + "3" * 40
         client.post("/v1/airdrop-exposure/base", json={"address": addr, "windowDays": 60})
         client.post("/v1/airdrop-exposure/base", json={"address": addr, "windowDays": 90})
-        assert mock_scan.call_count == 2
+        assert scan.call_count == 2
 
-    @patch("app.routes.airdrop._detect_wallet_type", new_callable=AsyncMock, return_value="eoa")
-    @patch("app.routes.airdrop.scan_wallet", new_callable=AsyncMock, side_effect=_mock_scan_result)
-    def test_different_chains_different_cache(self, mock_scan, mock_wt):
+    def test_different_chains_different_cache(self, mocked_scan):
+        scan, _ = mocked_scan
         """Same address on different chains should produce cache misses."""
         # We only need a valid address per chain
         client.post("/v1/airdrop-exposure/base", json={"address": "0x" + "4" * 40})
@@ -515,14 +502,13 @@ class TestCacheKeyIsolation:
             "/v1/airdrop-exposure/solana",
             json={"address": "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"},
         )
-        assert mock_scan.call_count == 2
+        assert scan.call_count == 2
 
-    @patch("app.routes.airdrop._detect_wallet_type", new_callable=AsyncMock, return_value="eoa")
-    @patch("app.routes.airdrop.scan_wallet", new_callable=AsyncMock, side_effect=_mock_scan_result)
-    def test_different_addresses_different_cache(self, mock_scan, mock_wt):
+    def test_different_addresses_different_cache(self, mocked_scan):
+        scan, _ = mocked_scan
         client.post("/v1/airdrop-exposure/base", json={"address": "0x" + "5" * 40})
         client.post("/v1/airdrop-exposure/base", json={"address": "0x" + "6" * 40})
-        assert mock_scan.call_count == 2
+        assert scan.call_count == 2
 
 
 class TestInputEdgeCases:
@@ -538,29 +524,18 @@ class TestInputEdgeCases:
         # "  0x...  ".strip() → "0x..." → valid
         assert resp.status_code != 500  # Should not crash
 
+    @pytest.mark.usefixtures("mocked_scan")
     def test_address_with_mixed_case_normalized(self):
         """Mixed-case EVM address should be normalized to lowercase."""
-        from app.models.response import TokenlessSignal, TokenedSignal
-
-        def mock_scan(*a, **kw):
-            return [
-                TokenlessSignal(
-                    protocol_id="p", protocol_name="P", category="dex",
-                    protocol_weight=1.0, interacted=False, detection_mode="event_topic",
-                )
-            ], [], "full", []
-
-        with patch("app.routes.airdrop.scan_wallet", new_callable=AsyncMock, side_effect=mock_scan):
-            with patch("app.routes.airdrop._detect_wallet_type", new_callable=AsyncMock, return_value="eoa"):
-                mixed = "0xAbCdEf" + "1234567890" * 3 + "abCDef12"
-                if len(mixed) != 42:
-                    mixed = "0xAbCdEf1234567890abcdef1234567890ABCDEF12"
-                resp = client.post(
-                    "/v1/airdrop-exposure/base",
-                    json={"address": mixed},
-                )
-                if resp.status_code == 200:
-                    assert resp.json()["address"] == mixed.lower()
+        mixed = "0xAbCdEf" + "1234567890" * 3 + "abCDef12"
+        if len(mixed) != 42:
+            mixed = "0xAbCdEf1234567890abcdef1234567890ABCDEF12"
+        resp = client.post(
+            "/v1/airdrop-exposure/base",
+            json={"address": mixed},
+        )
+        if resp.status_code == 200:
+            assert resp.json()["address"] == mixed.lower()
 
     def test_empty_string_address(self):
         resp = client.post(
@@ -583,26 +558,17 @@ class TestInputEdgeCases:
         )
         assert resp.status_code == 400
 
+    @pytest.mark.usefixtures("mocked_scan")
     def test_scan_timestamp_is_iso_format(self):
         """scan_timestamp should be a valid ISO 8601 string."""
         from datetime import datetime as dt
 
-        def mock_scan(*a, **kw):
-            return [
-                TokenlessSignal(
-                    protocol_id="p", protocol_name="P", category="dex",
-                    protocol_weight=1.0, interacted=False, detection_mode="event_topic",
-                )
-            ], [], "full", []
-
-        with patch("app.routes.airdrop.scan_wallet", new_callable=AsyncMock, side_effect=mock_scan):
-            with patch("app.routes.airdrop._detect_wallet_type", new_callable=AsyncMock, return_value="eoa"):
-                resp = client.post(
-                    "/v1/airdrop-exposure/base",
-                    json={"address": "0x" + "7" * 40},
-                )
-                assert resp.status_code == 200
-                ts = resp.json()["scan_timestamp"]
-                # Should parse without error
-                parsed = dt.fromisoformat(ts)
-                assert parsed.year >= 2026
+        resp = client.post(
+            "/v1/airdrop-exposure/base",
+            json={"address": "0x" + "7" * 40},
+        )
+        assert resp.status_code == 200
+        ts = resp.json()["scan_timestamp"]
+        # Should parse without error
+        parsed = dt.fromisoformat(ts)
+        assert parsed.year >= 2026
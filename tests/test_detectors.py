@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import sys
+from dataclasses import replace
+
 import pytest
 
 from app.detectors.base import DetectionResult
@@ -22,17 +25,27 @@ from app.services.scanner import (
 )
 
 
+# Template instance reused via dataclasses.replace — cheaper than re-running
+# __init__ for every result the merge tests construct.
+_EMPTY_RESULT = DetectionResult()
+
+
+def _result(**overrides) -> DetectionResult:
+    overrides.setdefault("signal_types", [])
+    return replace(_EMPTY_RESULT, **overrides)
+
+
 class TestMergeResult:
     def test_merge_empty_into_empty(self):
-        target = DetectionResult()
-        source = DetectionResult()
+        target = _result()
+        source = _result()
         _merge_result(target, source)
         assert target.interacted is False
         assert target.interaction_count == 0
 
     def test_merge_interacted_into_empty(self):
-        target = DetectionResult()
-        source = DetectionResult(
+        target = _result()
+        source = _result(
             interacted=True,
             interaction_count=5,
             signal_types=["swap"],
@@ -47,11 +60,11 @@ class TestMergeResult:
         assert target.last_seen == "200"
 
     def test_merge_keeps_earliest_first_seen(self):
-        target = DetectionResult(
+        target = _result(
             interacted=True, interaction_count=3,
             first_seen="200", last_seen="300",
         )
-        source = DetectionResult(
+        source = _result(
             interacted=True, interaction_count=2,
             first_seen="100", last_seen="250",
         )
@@ -61,11 +74,11 @@ class TestMergeResult:
         assert target.last_seen == "300"
 
     def test_merge_keeps_latest_last_seen(self):
-        target = DetectionResult(
+        target = _result(
             interacted=True, interaction_count=1,
             first_seen="100", last_seen="200",
         )
-        source = DetectionResult(
+        source = _result(
             interacted=True, interaction_count=1,
             first_seen="150", last_seen="400",
         )
@@ -73,10 +86,10 @@ class TestMergeResult:
         assert target.last_seen == "400"
 
     def test_merge_accumulates_signal_types(self):
-        target = DetectionResult(
+        target = _result(
             interacted=True, signal_types=["swap"],
         )
-        source = DetectionResult(
+        source = _result(
             interacted=True, signal_types=["supply", "borrow"],
         )
         _merge_result(target, source)
@@ -111,8 +124,10 @@ class TestTimestampConversion:
 
 
 def _contract(address, detection_config=None, **kwargs):
-    return ContractEntry(
-        address=address,
+    # model_construct skips Pydantic validation — all values here are
+    # already the right types, so the tests don't pay for it.
+    return ContractEntry.model_construct(
+        address=sys.intern(address),
         label=kwargs.get("label", "test"),
         type=kwargs.get("type", "core"),
         detection_mode=kwargs.get("detection_mode", DetectionMode.PROGRAM_ID_MATCH),
@@ -265,12 +280,12 @@ class TestTxInvolvesProgram:
 class TestMergeResultEdgeCases:
     def test_merge_non_interacted_into_interacted(self):
         """Merging a non-interacted source should not change target."""
-        target = DetectionResult(
+        target = _result(
             interacted=True, interaction_count=5,
             first_seen="100", last_seen="200",
             signal_types=["swap"],
         )
-        source = DetectionResult(interacted=False)
+        source = _result(interacted=False)
         _merge_result(target, source)
         assert target.interacted is True
         assert target.interaction_count == 5
@@ -280,11 +295,11 @@ class TestMergeResultEdgeCases:
 
     def test_merge_source_with_none_first_seen(self):
         """Source interacted but first_seen is None → target first_seen unchanged."""
-        target = DetectionResult(
+        target = _result(
             interacted=True, interaction_count=2,
             first_seen="100", last_seen="200",
         )
-        source = DetectionResult(
+        source = _result(
             interacted=True, interaction_count=1,
             first_seen=None, last_seen="300",
         )
@@ -295,11 +310,11 @@ class TestMergeResultEdgeCases:
 
     def test_merge_source_with_none_last_seen(self):
         """Source interacted but last_seen is None → target last_seen unchanged."""
-        target = DetectionResult(
+        target = _result(
             interacted=True, interaction_count=2,
             first_seen="100", last_seen="200",
         )
-        source = DetectionResult(
+        source = _result(
             interacted=True, interaction_count=1,
             first_seen="050", last_seen=None,  # 50 < 100 as integers
         )
@@ -309,11 +324,11 @@ class TestMergeResultEdgeCases:
 
     def test_merge_first_seen_uses_integer_comparison(self):
         """first_seen/last_seen are compared as integers (block numbers)."""
-        target = DetectionResult(
+        target = _result(
             interacted=True, interaction_count=1,
             first_seen="100", last_seen="200",
         )
-        source = DetectionResult(
+        source = _result(
             interacted=True, interaction_count=1,
             first_seen="99", last_seen=None,
         )
@@ -323,13 +338,13 @@ class TestMergeResultEdgeCases:
 
     def test_merge_multiple_sources(self):
         """Merge 3 sources sequentially → accumulates correctly."""
-        target = DetectionResult()
+        target = _result()
         sources = [
-            DetectionResult(interacted=True, interaction_count=2, signal_types=["swap"],
+            _result(interacted=True, interaction_count=2, signal_types=["swap"],
                           first_seen="200", last_seen="300"),
-            DetectionResult(interacted=True, interaction_count=3, signal_types=["supply"],
+            _result(interacted=True, interaction_count=3, signal_types=["supply"],
                           first_seen="100", last_seen="250"),
-            DetectionResult(interacted=True, interaction_count=1, signal_types=["borrow"],
+            _result(interacted=True, interaction_count=1, signal_types=["borrow"],
                           first_seen="150", last_seen="400"),
         ]
         for s in sources:
@@ -342,8 +357,8 @@ class TestMergeResultEdgeCases:
 
     def test_merge_duplicate_signal_types(self):
         """Merge extends signal_types without deduplication (caller handles it)."""
-        target = DetectionResult(interacted=True, signal_types=["swap"])
-        source = DetectionResult(interacted=True, signal_types=["swap"])
+        target = _result(interacted=True, signal_types=["swap"])
+        source = _result(interacted=True, signal_types=["swap"])
         _merge_result(target, source)
         assert target.signal_types == ["swap", "swap"]
 
@@ -517,7 +532,7 @@ def _make_protocol(
     protocol_weight: float = 1.0,
     contracts: list | None = None,
 ) -> Protocol:
-    return Protocol(
+    return Protocol.model_construct(
         id=id,
         name=name,
         chain=chain,
@@ -552,7 +567,7 @@ class TestBuildTokenedSignal:
             id="uniswap", name="Uniswap", category="dex",
             has_token=True, token_symbol="UNI",
         )
-        result = DetectionResult(interacted=True, interaction_count=5)
+        result = _result(interacted=True, interaction_count=5)
         signal = _build_tokened_signal(p, result)
         assert signal.protocol_id == "uniswap"
         assert signal.protocol_name == "Uniswap"
@@ -564,7 +579,7 @@ class TestBuildTokenedSignal:
     def test_interacted_no_token_symbol(self):
         """has_token=True but token_symbol=None → empty note."""
         p = _make_protocol(has_token=True, token_symbol=None)
-        result = DetectionResult(interacted=True)
+        result = _result(interacted=True)
         signal = _build_tokened_signal(p, result)
         assert signal.note == ""
         assert signal.token_symbol == ""
@@ -572,7 +587,7 @@ class TestBuildTokenedSignal:
     def test_not_interacted_no_note(self):
         """Not interacted → note is always empty."""
         p = _make_protocol(has_token=True, token_symbol="TKN")
-        result = DetectionResult(interacted=False)
+        result = _result(interacted=False)
         signal = _build_tokened_signal(p, result)
         assert signal.interacted is False
         assert signal.note == ""
@@ -585,7 +600,7 @@ class TestBuildTokenlessSignal:
             id="morpho", name="Morpho", category="lending",
             protocol_weight=1.2, contracts=[c],
         )
-        result = DetectionResult(
+        result = _result(
             interacted=True, interaction_count=10,
             signal_types=["supply", "borrow", "supply"],
             first_seen="12345", last_seen="67890",
@@ -604,11 +619,11 @@ class TestBuildTokenlessSignal:
 
     def test_empty_result(self):
         p = _make_protocol(id="p1", contracts=[])
-        result = DetectionResult()
+        result = _result()
         signal = _build_tokenless_signal(p, result)
         assert signal.interacted is False
         assert signal.interaction_count == 0
-        assert signal.signal_types == []
+        assert signal.signal_types == ()
         assert signal.first_seen is None
         assert signal.last_seen is None
         assert signal.detection_mode == "unknown"
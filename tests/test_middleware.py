@@ -1,17 +1,16 @@
 from __future__ import annotations
 
+import asyncio
 import time
 from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
-from fastapi.testclient import TestClient
 
 from app.main import app
-from app.services.cache import scan_cache
+from app.services.cache import TTLCache
 from app.services.protocol_db import protocol_db
 
-client = TestClient(app)
-
 
 @pytest.fixture(scope="session", autouse=True)
 def load_protocols():
@@ -19,20 +18,51 @@ def load_protocols():
 
 
 @pytest.fixture(autouse=True)
-def clear_cache():
-    scan_cache.clear()
-    yield
-    scan_cache.clear()
+def scan_cache(monkeypatch):
+    """Give every test its own cache instance instead of clearing the global.
+
+    Avoids shared mutable state between tests, which keeps this module safe
+    for parallel runs (pytest-xdist).
+    """
+    fresh = TTLCache()
+    monkeypatch.setattr("app.services.cache.scan_cache", fresh)
+    monkeypatch.setattr("app.routes.airdrop.scan_cache", fresh)
+    return fresh
+
+
+@pytest.fixture
+def mocked_scan(monkeypatch):
+    """Wire scan_wallet/_detect_wallet_type mocks once via monkeypatch.
+
+    Cheaper than stacked `with patch(...)` blocks, which re-locate the
+    patch target on every use.
+    """
+    from app.models.response import TokenlessSignal
+
+    def _mock_scan(*a, **kw):
+        return [
+            TokenlessSignal(
+                protocol_id="p", protocol_name="P", category="dex",
+                protocol_weight=1.0, interacted=False, detection_mode="event_topic",
+            )
+        ], [], "full", []
+
+    scan = AsyncMock(side_effect=_mock_scan)
+    monkeypatch.setattr("app.routes.airdrop.scan_wallet", scan)
+    monkeypatch.setattr(
+        "app.routes.airdrop._detect_wallet_type", AsyncMock(return_value="eoa")
+    )
+    return scan
 
 
 class TestAPIX402EdgeCases:
-    def test_empty_json_body_returns_400(self):
+    def test_empty_json_body_returns_400(self, client):
         """POST with {} should return 400 for missing address."""
         resp = client.post("/v1/airdrop-exposure/base", json={})
         assert resp.status_code == 400
         assert "address" in resp.json()["error"].lower()
 
-    def test_non_json_body_handled_gracefully(self):
+    def test_non_json_body_handled_gracefully(self, client):
         """POST with non-JSON content-type should not crash."""
         resp = client.post(
             "/v1/airdrop-exposure/base",
@@ -42,7 +72,7 @@ class TestAPIX402EdgeCases:
         # Should get 400 (missing address), not 500
         assert resp.status_code == 400
 
-    def test_deeply_nested_body_only_one_level(self):
+    def test_deeply_nested_body_only_one_level(self, client):
         """Only one level of body nesting is unwrapped."""
         resp = client.post(
             "/v1/airdrop-exposure/base",
@@ -53,45 +83,46 @@ class TestAPIX402EdgeCases:
         # extract_param checks body["body"]["address"] → finds it
         assert resp.status_code in (200, 400)
 
-    def test_nested_body_with_extra_top_level_fields(self):
+    def test_nested_body_with_extra_top_level_fields(self, client, mocked_scan):
         """APIX402 wrapping may include extra fields alongside body."""
-        from app.models.response import TokenlessSignal, TokenedSignal
-
-        def _mock_scan(*a, **kw):
-            return [
-                TokenlessSignal(
-                    protocol_id="p", protocol_name="P", category="dex",
-                    protocol_weight=1.0, interacted=False, detection_mode="event_topic",
-                )
-            ], [], "full", []
-
-        with patch("app.routes.airdrop.scan_wallet", new_callable=AsyncMock, side_effect=_mock_scan):
-            with patch("app.routes.airdrop._detect_wallet_type", new_callable=AsyncMock, return_value="eoa"):
-                resp = client.post(
-                    "/v1/airdrop-exposure/base",
-                    json={
-                        "agentId": "agent-123",
-                        "body": {"address": "0x" + "a" * 40, "windowDays": 45},
-                    },
-                )
-                assert resp.status_code == 200
-                assert resp.json()["scan_window_days"] == 45
-
-    def test_get_requests_bypass_body_parsing(self):
+        resp = client.post(
+            "/v1/airdrop-exposure/base",
+            json={
+                "agentId": "agent-123",
+                "body": {"address": "0x" + "a" * 40, "windowDays": 45},
+            },
+        )
+        assert resp.status_code == 200
+        assert resp.json()["scan_window_days"] == 45
+
+    def test_get_requests_bypass_body_parsing(self, client):
         """GET requests should not attempt body parsing."""
         resp = client.get("/v1/airdrop-exposure/base")
         assert resp.status_code == 200
         assert resp.json()["method"] == "POST"
 
 
+@pytest.fixture
+async def async_client():
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as ac:
+        yield ac
+
+
 class TestRateLimiting:
-    def test_get_requests_not_rate_limited(self):
-        """GET requests should bypass rate limiting entirely."""
-        for _ in range(150):
-            resp = client.get("/health")
-            assert resp.status_code == 200
+    async def test_get_requests_not_rate_limited(self, async_client):
+        """GET requests should bypass rate limiting entirely.
+
+        Fired concurrently — overlapping requests against the shared
+        limiter state prove the bypass better than a sequential loop,
+        and finish in roughly one round trip.
+        """
+        responses = await asyncio.gather(
+            *(async_client.get("/health") for _ in range(150))
+        )
+        assert all(r.status_code == 200 for r in responses)
 
-    def test_post_within_limit_succeeds(self):
+    def test_post_within_limit_succeeds(self, client):
         """A single POST should not be rate limited."""
         resp = client.post(
             "/v1/airdrop-exposure/base",
@@ -102,14 +133,14 @@ class TestRateLimiting:
 
 
 class TestErrorResponseStructure:
-    def test_missing_address_error_has_no_hint(self):
+    def test_missing_address_error_has_no_hint(self, client):
         """After refactor, error responses should not have hardcoded hint."""
         resp = client.post("/v1/airdrop-exposure/base", json={})
         data = resp.json()
         assert "hint" not in data
         assert "error" in data
 
-    def test_invalid_address_error_includes_received_body(self):
+    def test_invalid_address_error_includes_received_body(self, client):
         """Invalid address errors should include the received body for debugging."""
         body = {"address": "bad_addr"}
         resp = client.post("/v1/airdrop-exposure/base", json=body)
@@ -117,14 +148,14 @@ class TestErrorResponseStructure:
         assert data["error"].startswith("Invalid")
         assert "received_body" in data
 
-    def test_unsupported_chain_error_has_no_received_body(self):
+    def test_unsupported_chain_error_has_no_received_body(self, client):
         """Chain validation errors don't pass received_body."""
         resp = client.get("/v1/airdrop-exposure/ethereum")
         data = resp.json()
         assert "error" in data
         assert "received_body" not in data
 
-    def test_503_no_protocols_error(self):
+    def test_503_no_protocols_error(self, client):
         """If protocol_db returns empty list, should get 503."""
         with patch("app.routes.airdrop.protocol_db") as mock_db:
             mock_db.get_by_chain.return_value = []
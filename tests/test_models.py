@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 from app.models.response import (
     DISCLAIMER,
     CategoryCoverage,
@@ -9,6 +11,7 @@ from app.models.response import (
     SummaryMetrics,
     TokenedSignal,
     TokenlessSignal,
+    dump,
 )
 
 
@@ -52,11 +55,10 @@ class TestSummaryMetrics:
         assert s.overall_likelihood == "minimal"
         assert isinstance(s.category_coverage, CategoryCoverage)
 
-    def test_overall_likelihood_values(self):
+    @pytest.mark.parametrize("val", ["minimal", "low", "medium", "high"])
+    def test_overall_likelihood_values(self, val):
         """All valid likelihood values can be set."""
-        for val in ("minimal", "low", "medium", "high"):
-            s = SummaryMetrics(overall_likelihood=val)
-            assert s.overall_likelihood == val
+        assert SummaryMetrics(overall_likelihood=val).overall_likelihood == val
 
 
 class TestTokenlessSignal:
@@ -77,7 +79,7 @@ class TestTokenlessSignal:
         dumped = signal.model_dump()
         assert dumped["protocol_id"] == "morpho_base"
         assert dumped["interaction_count"] == 14
-        assert dumped["signal_types"] == ["supply", "borrow"]
+        assert dumped["signal_types"] == ("supply", "borrow")
 
     def test_defaults(self):
         signal = TokenlessSignal(
@@ -91,17 +93,17 @@ class TestTokenlessSignal:
         assert signal.first_seen is None
         assert signal.last_seen is None
         assert signal.interaction_count == 0
-        assert signal.signal_types == []
+        assert signal.signal_types == ()
         assert signal.signal_strength == "none"
 
-    def test_signal_strength_values(self):
-        for val in ("none", "weak", "moderate", "strong"):
-            signal = TokenlessSignal(
-                protocol_id="p", protocol_name="P", category="dex",
-                protocol_weight=1.0, interacted=False, detection_mode="x",
-                signal_strength=val,
-            )
-            assert signal.signal_strength == val
+    @pytest.mark.parametrize("val", ["none", "weak", "moderate", "strong"])
+    def test_signal_strength_values(self, val):
+        signal = TokenlessSignal(
+            protocol_id="p", protocol_name="P", category="dex",
+            protocol_weight=1.0, interacted=False, detection_mode="x",
+            signal_strength=val,
+        )
+        assert signal.signal_strength == val
 
 
 class TestTokenedSignal:
@@ -129,7 +131,7 @@ class TestTokenedSignal:
 class TestNextAction:
     def test_defaults(self):
         action = NextAction(action="Do something", reason="Because")
-        assert action.suggested_protocols == []
+        assert action.suggested_protocols == ()
 
     def test_full_action(self):
         action = NextAction(
@@ -158,10 +160,10 @@ class TestScanResponse:
         )
         assert resp.scan_completeness == "full"
         assert resp.wallet_type == "eoa"
-        assert resp.tokenless_signals == []
-        assert resp.tokened_signals == []
-        assert resp.next_actions == []
-        assert resp.skipped_protocols == []
+        assert resp.tokenless_signals == ()
+        assert resp.tokened_signals == ()
+        assert resp.next_actions == ()
+        assert resp.skipped_protocols == ()
         assert resp.partial_scan_note is None
         assert resp.wallet_note is None
         assert resp.disclaimer == DISCLAIMER
@@ -177,7 +179,8 @@ class TestScanResponse:
             scan_completeness="partial",
             partial_scan_note="Truncated",
         )
-        dumped = resp.model_dump(by_alias=True)
+        # Same cached-serializer path the API route uses.
+        dumped = dump(resp)
         assert dumped["wallet_type"] == "contract"
         assert dumped["wallet_note"] == "Smart contract wallet"
         assert dumped["scan_completeness"] == "partial"
@@ -26,24 +26,21 @@ class TestProtocolDBLoading:
 
 class TestProtocolDBQuerying:
     def test_get_by_chain_base(self):
-        protocol_db.load()
         base_protos = protocol_db.get_by_chain("base")
         assert len(base_protos) > 0
-        assert all(p.chain == "base" for p in base_protos)
+        # Set build + compare runs the loop in C instead of a Python genexpr.
+        assert {p.chain for p in base_protos} == {"base"}
 
     def test_get_by_chain_solana(self):
-        protocol_db.load()
         sol_protos = protocol_db.get_by_chain("solana")
         assert len(sol_protos) > 0
-        assert all(p.chain == "solana" for p in sol_protos)
+        assert {p.chain for p in sol_protos} == {"solana"}
 
     def test_get_by_chain_nonexistent(self):
-        protocol_db.load()
         result = protocol_db.get_by_chain("ethereum")
         assert result == []
 
     def test_get_protocol_by_id(self):
-        protocol_db.load()
         all_protos = protocol_db.all_protocols()
         if all_protos:
             p = all_protos[0]
@@ -52,65 +49,58 @@ class TestProtocolDBQuerying:
             assert fetched.id == p.id
 
     def test_get_nonexistent_protocol(self):
-        protocol_db.load()
         assert protocol_db.get("nonexistent_id_xyz") is None
 
 
 class TestProtocolDBFiltering:
     def test_get_tokenless(self):
-        protocol_db.load()
         tokenless = protocol_db.get_tokenless("base")
-        assert all(p.has_token is False for p in tokenless)
+        assert {p.has_token for p in tokenless} <= {False}
 
     def test_get_tokened(self):
-        protocol_db.load()
         tokened = protocol_db.get_tokened("base")
-        assert all(p.has_token is True for p in tokened)
+        assert {p.has_token for p in tokened} <= {True}
 
     def test_tokenless_plus_tokened_equals_all(self):
-        protocol_db.load()
         for chain in ("base", "solana"):
-            all_chain = protocol_db.get_by_chain(chain)
-            tokenless = protocol_db.get_tokenless(chain)
-            tokened = protocol_db.get_tokened(chain)
-            assert len(tokenless) + len(tokened) == len(all_chain)
+            total, tokenless, tokened = protocol_db.counts(chain)
+            assert tokenless + tokened == total
 
+    def test_counts_match_query_lengths(self):
+        for chain in ("base", "solana"):
+            total, tokenless, tokened = protocol_db.counts(chain)
+            assert total == len(protocol_db.get_by_chain(chain))
+            assert tokenless == len(protocol_db.get_tokenless(chain))
+            assert tokened == len(protocol_db.get_tokened(chain))
 
-class TestProtocolDBDataIntegrity:
-    def test_all_protocols_have_required_fields(self):
-        protocol_db.load()
-        for p in protocol_db.all_protocols():
-            assert p.id
-            assert p.name
-            assert p.chain
-            assert p.category
+    def test_counts_unknown_chain(self):
+        assert protocol_db.counts("ethereum") == (0, 0, 0)
 
-    def test_all_protocols_have_valid_category(self):
-        """Every protocol category should be one of the known categories."""
-        from app.models.protocol import ProtocolCategory
-        valid = {e.value for e in ProtocolCategory}
 
-        protocol_db.load()
-        for p in protocol_db.all_protocols():
-            assert p.category.value in valid, f"{p.id} has invalid category: {p.category}"
+class TestProtocolDBDataIntegrity:
+    def test_all_protocols_data_integrity(self):
+        """One pass over the catalog checking every record-level invariant.
 
-    def test_all_contracts_have_valid_detection_mode(self):
-        from app.models.protocol import DetectionMode
-        valid = {e.value for e in DetectionMode}
+        Fused from five separate loops — the checks are independent, so a
+        single traversal collects all failures at once.
+        """
+        from app.models.protocol import VALID_CATEGORIES, VALID_DETECTION_MODES
 
-        protocol_db.load()
+        errors: list[str] = []
         for p in protocol_db.all_protocols():
+            if not (p.id and p.name and p.chain and p.category):
+                errors.append(f"{p.id or '<no id>'}: missing required fields")
+            if p.category.value not in VALID_CATEGORIES:
+                errors.append(f"{p.id} has invalid category: {p.category}")
             for c in p.contracts:
-                assert c.detection_mode.value in valid, \
-                    f"{p.id}/{c.label} has invalid mode: {c.detection_mode}"
-
-    def test_tokened_protocols_have_token_symbol(self):
-        protocol_db.load()
-        for p in protocol_db.all_protocols():
-            if p.has_token:
-                assert p.token_symbol, f"{p.id} has_token=True but no token_symbol"
-
-    def test_protocol_weights_positive(self):
-        protocol_db.load()
-        for p in protocol_db.all_protocols():
-            assert p.protocol_weight > 0, f"{p.id} has non-positive weight: {p.protocol_weight}"
+                if c.detection_mode.value not in VALID_DETECTION_MODES:
+                    errors.append(
+                        f"{p.id}/{c.label} has invalid mode: {c.detection_mode}"
+                    )
+            if p.has_token and not p.token_symbol:
+                errors.append(f"{p.id} has_token=True but no token_symbol")
+            if not p.protocol_weight > 0:
+                errors.append(
+                    f"{p.id} has non-positive weight: {p.protocol_weight}"
+                )
+        assert not errors, "\n".join(errors)
@@ -83,48 +83,66 @@ class TestNormalizeAddress:
 
 
 class TestExtractParam:
-    def test_top_level_key(self):
-        body = {"address": "0xabc"}
-        assert extract_param(body, "address") == "0xabc"
-
-    def test_alias_match(self):
-        body = {"wallet": "0xabc"}
-        assert extract_param(body, "address", aliases=["wallet", "addr"]) == "0xabc"
-
-    def test_nested_body(self):
-        """APIX402 nesting: body.body.address"""
-        body = {"body": {"address": "0xabc"}}
-        assert extract_param(body, "address") == "0xabc"
-
-    def test_nested_body_with_alias(self):
-        body = {"body": {"wallet": "0xabc"}}
-        assert extract_param(body, "address", aliases=["wallet"]) == "0xabc"
-
-    def test_query_string_parsed_by_middleware(self):
-        """query field is now parsed into keys by middleware, not extract_param."""
-        body = {"query": "0xabc"}
-        assert extract_param(body, "address") is None
-
-    def test_missing_returns_none(self):
-        body = {"foo": "bar"}
-        assert extract_param(body, "address") is None
-
-    def test_top_level_takes_priority_over_nested(self):
-        body = {"address": "top", "body": {"address": "nested"}}
-        assert extract_param(body, "address") == "top"
-
-    def test_empty_body(self):
-        assert extract_param({}, "address") is None
-
-    def test_flat_apix402_body(self):
-        """Body already unwrapped by middleware."""
-        body = {"address": "0xabc", "windowDays": 90}
-        assert extract_param(body, "address") == "0xabc"
-        assert extract_param(body, "windowDays", aliases=["window_days"]) == 90
-
-    def test_window_days_alias(self):
-        body = {"address": "0xabc", "window_days": 60}
-        assert extract_param(body, "windowDays", aliases=["window_days", "days"]) == 60
+    # One parametrized test instead of per-case methods: a single
+    # collected function amortizes pytest's per-item setup, and the ids
+    # keep failures as readable as the old method names.
+    @pytest.mark.parametrize(
+        "body, param, aliases, expected",
+        [
+            pytest.param(
+                {"address": "0xabc"}, "address", None, "0xabc",
+                id="top-level-key",
+            ),
+            pytest.param(
+                {"wallet": "0xabc"}, "address", ["wallet", "addr"], "0xabc",
+                id="alias-match",
+            ),
+            # APIX402 nesting: body.body.address
+            pytest.param(
+                {"body": {"address": "0xabc"}}, "address", None, "0xabc",
+                id="nested-body",
+            ),
+            pytest.param(
+                {"body": {"wallet": "0xabc"}}, "address", ["wallet"], "0xabc",
+                id="nested-body-with-alias",
+            ),
+            # query field is parsed into keys by middleware, not extract_param.
+            pytest.param(
+                {"query": "0xabc"}, "address", None, None,
+                id="query-string-parsed-by-middleware",
+            ),
+            pytest.param(
+                {"foo": "bar"}, "address", None, None,
+                id="missing-returns-none",
+            ),
+            pytest.param(
+                {"address": "top", "body": {"address": "nested"}},
+                "address", None, "top",
+                id="top-level-takes-priority-over-nested",
+            ),
+            pytest.param({}, "address", None, None, id="empty-body"),
+            # Body already unwrapped by middleware.
+            pytest.param(
+                {"address": "0xabc", "windowDays": 90}, "address", None, "0xabc",
+                id="flat-apix402-address",
+            ),
+            pytest.param(
+                {"address": "0xabc", "windowDays": 90},
+                "windowDays", ["window_days"], 90,
+                id="flat-apix402-window-days",
+            ),
+            pytest.param(
+                {"address": "0xabc", "window_days": 60},
+                "windowDays", ["window_days", "days"], 60,
+                id="window-days-alias",
+            ),
+        ],
+    )
+    def test_extract_param(self, body, param, aliases, expected):
+        result = extract_param(body, param, aliases)
+        assert result == expected
+        # Exact-type check keeps the old `is None` / `is True` strictness.
+        assert type(result) is type(expected)
 
 
 class TestPadEvmAddress:
@@ -205,37 +223,46 @@ class TestNormalizeAddressBoundaries:
 
 
 class TestExtractParamEdgeCases:
-    def test_body_key_is_string_not_dict(self):
-        """If body['body'] is not a dict, should not recurse into it."""
-        body = {"body": "just_a_string"}
-        assert extract_param(body, "address") is None
-
-    def test_body_key_is_list(self):
-        body = {"body": ["not", "a", "dict"]}
-        assert extract_param(body, "address") is None
-
-    def test_numeric_value_preserved(self):
-        body = {"windowDays": 60}
-        assert extract_param(body, "windowDays") == 60
-
-    def test_boolean_value_preserved(self):
-        body = {"verbose": True}
-        assert extract_param(body, "verbose") is True
-
-    def test_first_alias_wins_over_later(self):
-        """If multiple aliases match, first one checked wins."""
-        body = {"wallet": "wallet_val", "addr": "addr_val"}
-        result = extract_param(body, "address", aliases=["wallet", "addr"])
-        assert result == "wallet_val"
-
-    def test_query_not_used_if_primary_found(self):
-        """query fallback should NOT be used when primary key exists."""
-        body = {"address": "real_address", "query": "query_value"}
-        result = extract_param(body, "address")
-        assert result == "real_address"
-
-    def test_none_body_key_value(self):
-        """If the matched key has None value, it should be returned as None."""
-        body = {"address": None}
-        result = extract_param(body, "address")
-        assert result is None
+    @pytest.mark.parametrize(
+        "body, param, aliases, expected",
+        [
+            # If body['body'] is not a dict, should not recurse into it.
+            pytest.param(
+                {"body": "just_a_string"}, "address", None, None,
+                id="body-key-is-string-not-dict",
+            ),
+            pytest.param(
+                {"body": ["not", "a", "dict"]}, "address", None, None,
+                id="body-key-is-list",
+            ),
+            pytest.param(
+                {"windowDays": 60}, "windowDays", None, 60,
+                id="numeric-value-preserved",
+            ),
+            pytest.param(
+                {"verbose": True}, "verbose", None, True,
+                id="boolean-value-preserved",
+            ),
+            # If multiple aliases match, the first one checked wins.
+            pytest.param(
+                {"wallet": "wallet_val", "addr": "addr_val"},
+                "address", ["wallet", "addr"], "wallet_val",
+                id="first-alias-wins-over-later",
+            ),
+            # query fallback should NOT be used when the primary key exists.
+            pytest.param(
+                {"address": "real_address", "query": "query_value"},
+                "address", None, "real_address",
+                id="query-not-used-if-primary-found",
+            ),
+            # An explicit None value is returned as None, not treated as missing.
+            pytest.param(
+                {"address": None}, "address", None, None,
+                id="none-body-key-value",
+            ),
+        ],
+    )
+    def test_extract_param_edge_case(self, body, param, aliases, expected):
+        result = extract_param(body, param, aliases)
+        assert result == expected
+        assert type(result) is type(expected)